@@ -1,17 +1,48 @@
 import streamlit as st
 import pandas as pd
 import io
-from data_cleaner import clean_missing_values, remove_duplicates, convert_data_types
+import matplotlib.pyplot as plt
+from data_cleaner import BACKENDS, clean_missing_values, remove_duplicates, convert_data_types
 from data_visualizer import plot_bar_chart, plot_pie_chart, plot_histogram
 
 st.set_page_config(page_title="XIII's Data Cleaning Tool", layout="wide")
+
+
+@st.cache_data(show_spinner=False)
+def _load_csv(file_bytes: bytes, engine: str = 'c') -> pd.DataFrame:
+    """Parse the uploaded CSV once and reuse it across reruns (keyed on raw bytes)."""
+    return pd.read_csv(io.BytesIO(file_bytes), engine=engine)
+
+
+@st.cache_data(show_spinner=False)
+def _clean(df: pd.DataFrame, handle_missing: bool, remove_dups: bool, convert_types: bool,
+           backend: str = 'pandas') -> pd.DataFrame:
+    """Run the selected cleaning steps, cached per DataFrame content and option combination."""
+    cleaned_df = df
+
+    if handle_missing:
+        cleaned_df = clean_missing_values(cleaned_df, backend=backend)
+
+    if remove_dups:
+        cleaned_df = remove_duplicates(cleaned_df, backend=backend)
+
+    if convert_types:
+        cleaned_df = convert_data_types(cleaned_df)
+
+    return cleaned_df
+
+
 st.title("🧹 Data Cleaning and Visualization Tool(XIII)")
 
 # File uploader
 uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
 
+# Loading options
+st.sidebar.header("Loading Options")
+engine = st.sidebar.selectbox("CSV Parser Engine", ["c", "pyarrow"], index=0)
+
 if uploaded_file:
-    df = pd.read_csv(uploaded_file)
+    df = _load_csv(uploaded_file.getvalue(), engine)
     st.subheader("📊 Original Data Preview")
     st.dataframe(df.head())
     st.dataframe(df.tail())
@@ -21,18 +52,10 @@ if uploaded_file:
     handle_missing = st.sidebar.checkbox("Handle Missing Values")
     remove_dups = st.sidebar.checkbox("Remove Duplicates")
     convert_types = st.sidebar.checkbox("Convert Data Types")
+    backend = st.sidebar.selectbox("Cleaning Backend", BACKENDS, index=0)
 
     # Apply cleaning
-    cleaned_df = df.copy()
-
-    if handle_missing:
-        cleaned_df = clean_missing_values(cleaned_df)
-
-    if remove_dups:
-        cleaned_df = remove_duplicates(cleaned_df)
-
-    if convert_types:
-        cleaned_df = convert_data_types(cleaned_df)
+    cleaned_df = _clean(df, handle_missing, remove_dups, convert_types, backend)
 
     st.subheader("🧽 Cleaned Data Preview")
     st.dataframe(cleaned_df.head())
@@ -94,6 +117,9 @@ if st.sidebar.button("Generate Plot"):
     fig.savefig(plot_buffer, format='png', dpi=300, bbox_inches='tight')
     plot_buffer.seek(0)
 
+    # ✅ Release the figure so reruns don't accumulate open figures
+    plt.close(fig)
+
     # ✅ Download button for the plot
     st.download_button(
         label="📥 Download Plot as PNG",
@@ -104,9 +130,9 @@ if st.sidebar.button("Generate Plot"):
 
 
     # Download cleaned data
-    buffer = io.StringIO()
-    cleaned_df.to_csv(buffer, index=False)
+    buffer = io.BytesIO()
+    cleaned_df.to_csv(buffer, index=False, compression='gzip')
     st.download_button(label="📥 Download Cleaned CSV (You're welcome 😊)",
                        data=buffer.getvalue(),
-                       file_name="cleaned_data.csv",
-                       mime="text/csv")
+                       file_name="cleaned_data.csv.gz",
+                       mime="application/gzip")
@@ -5,13 +5,93 @@ Data Cleaning Module
 This module provides functions for cleaning pandas DataFrames, including
 handling missing values, removing duplicates, and converting data types.
 Each function takes a DataFrame as input and returns a cleaned DataFrame.
+The input DataFrame is never modified; copy-on-write lets the returned
+DataFrame share memory with the input for the columns that were not changed.
 """
 
+import warnings
+
 import pandas as pd
 import numpy as np
 
+# Polars is optional and only needed for backend='polars'
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+BACKENDS = ('pandas', 'polars')
+
+# Copy-on-write is always on from pandas 3.0, where the option is deprecated
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
 
-def clean_missing_values(df):
+def _check_backend(backend):
+    """Validate the backend name and make sure its package is installed."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend == 'polars' and pl is None:
+        raise ImportError("The polars backend requires the 'polars' package (pip install polars)")
+
+
+def _to_polars(df):
+    """
+    Convert a pandas DataFrame to Polars.
+    
+    Returns None if Polars cannot represent a column, e.g. an object column
+    mixing strings and numbers.
+    """
+    try:
+        return pl.from_pandas(df)
+    except (ValueError, TypeError):
+        return None
+
+
+def _from_polars(pl_df, df):
+    """
+    Convert a Polars result back to pandas with the dtypes of df.
+    
+    Unordered categoricals compare equal whatever their category order, so
+    astype keeps the order Polars returned; categories are reset explicitly.
+    """
+    result = pl_df.to_pandas().astype(df.dtypes.to_dict())
+    for column in df.select_dtypes(include='category').columns:
+        result[column] = result[column].cat.set_categories(df[column].cat.categories)
+    return result
+
+
+def _clean_missing_values_polars(df, pl_df):
+    """Polars implementation of clean_missing_values."""
+    null_counts = pl_df.null_count().row(0)
+    
+    fill_exprs = []
+    for i, (column, dtype, null_count) in enumerate(zip(pl_df.columns, pl_df.dtypes, null_counts)):
+        if null_count == 0:
+            continue
+        col = pl.col(column)
+        # Match pandas: timedeltas count as numeric, only naive datetimes are forward filled
+        if dtype.is_numeric() or dtype == pl.Duration:
+            fill_exprs.append(col.fill_null(col.median()))
+        elif dtype == pl.Datetime and dtype.time_zone is None:
+            fill_exprs.append(col.fill_null(strategy='forward').fill_null(strategy='backward'))
+        elif isinstance(df.dtypes.iloc[i], pd.CategoricalDtype):
+            # Ties resolve by category order, which Polars does not keep
+            value_counts = df.iloc[:, i].value_counts(sort=False)
+            if not value_counts.empty:
+                fill_exprs.append(col.fill_null(pl.lit(value_counts.idxmax())))
+        else:
+            # Ties resolve to the mode that appears first in the column
+            fill_exprs.append(col.fill_null(col.filter(col.is_in(col.drop_nulls().mode())).first()))
+    
+    if not fill_exprs:
+        return df.copy(deep=False)
+    
+    # Restore the pandas dtypes (e.g. Int64, string, category) lost in the round trip
+    return _from_polars(pl_df.with_columns(fill_exprs), df).set_axis(df.index)
+
+
+def clean_missing_values(df, backend='pandas'):
     """
     Detect and handle missing values in a DataFrame.
     
@@ -25,47 +105,90 @@ def clean_missing_values(df):
     -----------
     df : pandas.DataFrame
         The input DataFrame to clean
+    backend : str, optional
+        'pandas' (default) or 'polars' to run the fills in parallel with Polars
         
     Returns:
     --------
     pandas.DataFrame
         A DataFrame with missing values handled
     """
-    # Create a copy to avoid modifying the original DataFrame
-    cleaned_df = df.copy()
+    _check_backend(backend)
+    if backend == 'polars':
+        pl_df = _to_polars(df)
+        # Columns Polars cannot represent are handled by the pandas implementation
+        if pl_df is not None:
+            return _clean_missing_values_polars(df, pl_df)
     
     # Get information about missing values
-    missing_info = cleaned_df.isnull().sum()
-    columns_with_missing = missing_info[missing_info > 0].index.tolist()
+    columns_with_missing = df.columns[df.isna().any()].tolist()
     
-    # If no missing values, return the original DataFrame
+    # If no missing values, return a shallow copy of the original DataFrame
     if not columns_with_missing:
-        return cleaned_df
+        return df.copy(deep=False)
     
-    # Handle missing values based on data type
-    for column in columns_with_missing:
-        # Get the data type of the column
-        dtype = cleaned_df[column].dtype
-        
-        # Handle numeric columns (fill with median)
-        if np.issubdtype(dtype, np.number):
-            median_value = cleaned_df[column].median()
-            cleaned_df[column].fillna(median_value, inplace=True)
+    # Split the affected columns by data type
+    missing_df = df[columns_with_missing]
+    numeric_columns = missing_df.select_dtypes(include=np.number).columns
+    datetime_columns = missing_df.select_dtypes(include='datetime').columns
+    other_columns = missing_df.columns.difference(numeric_columns.union(datetime_columns), sort=False)
+    
+    # Numeric columns are filled with their median, computed in one pass
+    fill_values = missing_df[numeric_columns].median().to_dict()
+    
+    # Categorical/object columns are filled with their most frequent value;
+    # unsorted counts resolve ties by first appearance (category order for categoricals)
+    for column in other_columns:
+        value_counts = missing_df[column].value_counts(sort=False)
+        if not value_counts.empty:
+            fill_values[column] = value_counts.idxmax()
+    
+    # Apply all median/mode fills with a single call (returns a new DataFrame)
+    cleaned_df = df.fillna(value=fill_values)
+    
+    # Datetime columns are forward filled, then backward filled
+    if len(datetime_columns) > 0:
+        cleaned_df[datetime_columns] = missing_df[datetime_columns].ffill().bfill()
+    
+    return cleaned_df
+
+
+def _first_occurrence_mask(df):
+    """
+    Return a boolean array marking the first occurrence of each distinct row.
+    
+    Each column is factorized to integer codes (categorical columns reuse their
+    existing codes) and the codes are combined into a single int64 key per row,
+    so rows are compared as integers rather than hashed as tuples of Python
+    objects. Missing values share one code, which
+    matches how drop_duplicates treats them.
+    """
+    max_key = np.iinfo(np.int64).max
+    row_keys = np.zeros(len(df), dtype=np.int64)
+    key_count = 1
+    
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Categorical columns already carry bounded integer codes
+            codes = column.cat.codes.to_numpy().astype(np.int64)
+            radix = len(column.cat.categories) + 1
+        else:
+            codes, uniques = pd.factorize(column)
+            radix = len(uniques) + 1
         
-        # Handle datetime columns (forward fill then backward fill)
-        elif pd.api.types.is_datetime64_dtype(dtype):
-            cleaned_df[column].fillna(method='ffill', inplace=True)
-            cleaned_df[column].fillna(method='bfill', inplace=True)
+        # Re-number the keys seen so far if the combined key would overflow
+        if key_count * radix > max_key:
+            row_keys, key_uniques = pd.factorize(row_keys)
+            key_count = len(key_uniques)
         
-        # Handle categorical/object columns (fill with mode)
-        else:
-            mode_value = cleaned_df[column].mode()[0]
-            cleaned_df[column].fillna(mode_value, inplace=True)
+        row_keys = row_keys * radix + (codes + 1)
+        key_count *= radix
     
-    return cleaned_df
+    return ~pd.Series(row_keys).duplicated().to_numpy()
 
 
-def remove_duplicates(df):
+def remove_duplicates(df, backend='pandas'):
     """
     Identify and remove duplicate rows from a DataFrame.
     
@@ -76,20 +199,34 @@ def remove_duplicates(df):
     -----------
     df : pandas.DataFrame
         The input DataFrame to clean
+    backend : str, optional
+        'pandas' (default) or 'polars' to detect duplicates in parallel with Polars
         
     Returns:
     --------
     pandas.DataFrame
         A DataFrame with duplicate rows removed
     """
-    # Create a copy to avoid modifying the original DataFrame
-    cleaned_df = df.copy()
+    _check_backend(backend)
     
     # Get the original row count
-    original_count = len(cleaned_df)
+    original_count = len(df)
     
-    # Remove duplicates, keeping the first occurrence
-    cleaned_df.drop_duplicates(inplace=True)
+    # Columns Polars cannot represent are handled by the pandas implementation
+    pl_df = _to_polars(df) if backend == 'polars' else None
+    
+    # Remove duplicates, keeping the first occurrence (returns a new DataFrame)
+    if pl_df is not None:
+        pl_unique = pl_df.unique(keep='first', maintain_order=True)
+        if len(pl_unique) == original_count:
+            cleaned_df = df.copy(deep=False)
+        else:
+            # Restore the pandas dtypes (e.g. Int64, string, category) lost in the round trip
+            cleaned_df = _from_polars(pl_unique, df)
+    elif original_count == 0 or len(df.columns) == 0:
+        cleaned_df = df.drop_duplicates()
+    else:
+        cleaned_df = df[_first_occurrence_mask(df)]
     
     # Get the new row count
     new_count = len(cleaned_df)
@@ -99,19 +236,56 @@ def remove_duplicates(df):
     
     # If duplicates were found, reset the index
     if duplicates_removed > 0:
-        cleaned_df.reset_index(drop=True, inplace=True)
+        cleaned_df = cleaned_df.reset_index(drop=True)
     
     return cleaned_df
 
 
+def _infer_column_type(col):
+    """
+    Convert an object/string column to a numeric, datetime or categorical column.
+    
+    Returns None if the column should be left as it is.
+    """
+    missing_count = col.isna().sum()
+    
+    # Probe a few values first so text columns are rejected without parsing every row
+    probe = col.dropna().head(100)
+    
+    # Column can be converted to numeric if coercion introduces no new nulls
+    if not pd.to_numeric(probe, errors='coerce').isna().any():
+        numeric_column = pd.to_numeric(col, errors='coerce')
+        if numeric_column.isna().sum() == missing_count:
+            return numeric_column
+    
+    # Column can be converted to datetime if coercion introduces no new nulls;
+    # the probe silences the warning pandas gives for values it cannot parse
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        probe_is_datetime = not pd.to_datetime(probe, errors='coerce').isna().any()
+    if probe_is_datetime:
+        datetime_column = pd.to_datetime(col, errors='coerce')
+        if datetime_column.isna().sum() == missing_count:
+            return datetime_column
+    
+    # Convert to categorical if the column has few unique values
+    # (less than 50% of total rows and fewer than 100 unique values)
+    unique_count = col.nunique()
+    if unique_count < min(100, len(col) * 0.5):
+        return col.astype('category')
+    
+    return None
+
+
 def convert_data_types(df):
     """
     Convert data types in a DataFrame to more appropriate types.
     
     This function attempts to convert:
-    - Object columns that contain numbers to numeric types
-    - Object columns that contain dates to datetime types
-    - Object columns with few unique values to categorical types
+    - Object/string columns that contain numbers to numeric types
+    - Object/string columns that contain dates to datetime types
+    - Object/string columns with few unique values to categorical types
+    - 64-bit numeric columns to the narrowest dtype that holds their values
     
     Parameters:
     -----------
@@ -123,37 +297,26 @@ def convert_data_types(df):
     pandas.DataFrame
         A DataFrame with optimized data types
     """
-    # Create a copy to avoid modifying the original DataFrame
-    cleaned_df = df.copy()
+    # Shallow copy: converted columns are replaced, the rest share memory with df
+    cleaned_df = df.copy(deep=False)
     
-    # Process each column
-    for column in cleaned_df.columns:
-        # Skip columns that are already numeric or datetime
-        if pd.api.types.is_numeric_dtype(cleaned_df[column]) or pd.api.types.is_datetime64_dtype(cleaned_df[column]):
-            continue
-        
-        # Try to convert object columns to numeric
-        if cleaned_df[column].dtype == 'object':
-            # Check if column can be converted to numeric
-            try:
-                numeric_column = pd.to_numeric(cleaned_df[column])
-                cleaned_df[column] = numeric_column
-                continue
-            except (ValueError, TypeError):
-                pass
-            
-            # Check if column can be converted to datetime
-            try:
-                datetime_column = pd.to_datetime(cleaned_df[column])
-                cleaned_df[column] = datetime_column
-                continue
-            except (ValueError, TypeError):
-                pass
-            
-            # Convert to categorical if the column has few unique values
-            # (less than 50% of total rows and fewer than 100 unique values)
-            unique_count = cleaned_df[column].nunique()
-            if unique_count < min(100, len(cleaned_df) * 0.5):
-                cleaned_df[column] = cleaned_df[column].astype('category')
-    
-    return cleaned_df
\ No newline at end of file
+    # Only object/string columns are candidates for conversion
+    object_columns = cleaned_df.select_dtypes(include=['object', 'string']).columns
+    
+    for column in object_columns:
+        converted_column = _infer_column_type(cleaned_df[column])
+        if converted_column is not None:
+            cleaned_df[column] = converted_column
+    
+    # Downcast 64-bit numeric columns to narrower dtypes to save memory
+    for column in cleaned_df.select_dtypes(include=['int64', 'float64']).columns:
+        col = cleaned_df[column]
+        if pd.api.types.is_integer_dtype(col):
+            cleaned_df[column] = pd.to_numeric(col, downcast='integer')
+        else:
+            # Only keep float32 when it represents every value exactly
+            downcast_column = pd.to_numeric(col, downcast='float')
+            if downcast_column.dtype != col.dtype and downcast_column.astype(col.dtype).equals(col):
+                cleaned_df[column] = downcast_column
+    
+    return cleaned_df
@@ -5,16 +5,53 @@ This module provides functions to visualize data from a pandas DataFrame
 using Seaborn for enhanced aesthetics.
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Figures are returned, never shown, so skip GUI backend startup
+
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import Optional
+from scipy.stats import gaussian_kde
+
+# The KDE overlay is estimated from at most this many randomly sampled values
+KDE_SAMPLE_SIZE = 10_000
+
+
+def _plot_numeric_distribution(ax, column: pd.Series, bins: int = 20) -> None:
+    """
+    Draw a histogram with a KDE overlay of a numeric column onto ax.
+    
+    The values are binned once with np.histogram and only the bin counts are
+    handed to Seaborn. The KDE is estimated from a random sample of the values
+    and scaled to match the histogram counts.
+    """
+    values = column.to_numpy(dtype=float, na_value=np.nan)
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    
+    color = sns.color_palette()[0]
+    sns.histplot(x=edges[:-1], weights=counts, bins=len(counts), binrange=(edges[0], edges[-1]),
+                 color=color, alpha=0.5, ax=ax)
+    
+    # Sample the values for the KDE; the curve shape is unchanged at this size
+    if len(values) > KDE_SAMPLE_SIZE:
+        rng = np.random.default_rng(0)
+        sample = rng.choice(values, KDE_SAMPLE_SIZE, replace=False)
+    else:
+        sample = values
+    
+    # A KDE needs at least two distinct values
+    if len(sample) > 1 and np.ptp(sample) > 0:
+        grid = np.linspace(edges[0], edges[-1], 200)
+        density = gaussian_kde(sample)(grid)
+        ax.plot(grid, density * len(values) * (edges[1] - edges[0]), color=color)
 
 
 def plot_bar_chart(df: pd.DataFrame, column_name: str, sns_style: str = 'darkgrid', 
                   figsize: tuple = (10, 6), title: Optional[str] = None, 
-                  bins: int = 20) -> None:
+                  bins: int = 20) -> plt.Figure:
     """
     Generate a bar chart showing the distribution of values in the specified column.
     
@@ -33,6 +70,11 @@ def plot_bar_chart(df: pd.DataFrame, column_name: str, sns_style: str = 'darkgri
     bins : int, optional
         Number of bins for numerical data (default: 20)
         
+    Returns:
+    --------
+    matplotlib.figure.Figure
+        The figure containing the plot
+        
     Raises:
     -------
     TypeError
@@ -62,12 +104,14 @@ def plot_bar_chart(df: pd.DataFrame, column_name: str, sns_style: str = 'darkgri
     
     if is_numeric:
         # For numeric data, create a histogram
-        ax = sns.histplot(df[column_name], kde=True, bins=bins)
+        column = df[column_name]
+        _plot_numeric_distribution(ax, column, bins=bins)
         
         # Add descriptive statistics as text
-        stats_text = (f"Mean: {df[column_name].mean():.2f}\n"
-                      f"Median: {df[column_name].median():.2f}\n"
-                      f"Std Dev: {df[column_name].std():.2f}")
+        stats = column.agg(['mean', 'median', 'std'])
+        stats_text = (f"Mean: {stats['mean']:.2f}\n"
+                      f"Median: {stats['median']:.2f}\n"
+                      f"Std Dev: {stats['std']:.2f}")
         
         ax.text(0.95, 0.95, stats_text,
                  transform=ax.transAxes,
@@ -81,20 +125,14 @@ def plot_bar_chart(df: pd.DataFrame, column_name: str, sns_style: str = 'darkgri
         
     else:
         # For categorical data, create a bar chart of value counts
-        value_counts = df[column_name].value_counts().reset_index()
-        value_counts.columns = [column_name, 'Count']
-        
         # ✅ Optional: limit to top N categories (e.g., 50) for better readability
         top_n = 50
-        value_counts = value_counts.head(top_n)
+        value_counts = df[column_name].value_counts(sort=False).nlargest(top_n)
 
-        sns.barplot(x=column_name, y='Count', data=value_counts, ax=ax)
+        sns.barplot(x=value_counts.index, y=value_counts.values, order=value_counts.index, ax=ax)
         
         # Add count labels on top of bars
-        for p in ax.patches:
-            ax.annotate(f'{int(p.get_height())}', 
-                       (p.get_x() + p.get_width() / 2., p.get_height()),
-                       ha='center', va='bottom')
+        ax.bar_label(ax.containers[-1], fmt='%d', padding=2)
         
         # Set labels
         ax.set_xlabel(column_name, fontsize=12)
@@ -106,14 +144,18 @@ def plot_bar_chart(df: pd.DataFrame, column_name: str, sns_style: str = 'darkgri
         title = f'Distribution of {column_name}'
     ax.set_title(title, fontsize=15)
     
-    # Display the plot
     fig.tight_layout()
     return fig
     
 def plot_histogram(df, column_name, sns_style='darkgrid', figsize=(10, 6), title=None, bins=20):
     sns.set_style(sns_style)
     fig, ax = plt.subplots(figsize=figsize)
-    sns.histplot(df[column_name], kde=True, bins=bins, ax=ax)
+    column = df[column_name]
+    if pd.api.types.is_numeric_dtype(column):
+        _plot_numeric_distribution(ax, column, bins=bins)
+    else:
+        # Non-numeric values cannot be pre-binned; let Seaborn count them
+        sns.histplot(column, ax=ax)
 
     if title is None:
         title = f'Histogram of {column_name}'
@@ -128,7 +170,7 @@ def plot_pie_chart(df, column_name, title=None):
     value_counts = df[column_name].value_counts()
     fig, ax = plt.subplots(figsize=(8, 8))
     ax.pie(value_counts, labels=value_counts.index, autopct='%1.1f%%', startangle=140)
-    ax.axiis('equal')
+    ax.axis('equal')
     if title is None:
         title = f'Distribution of {column_name}'
     ax.set_title(title, fontsize=15)
@@ -9,6 +9,7 @@ and outputs the cleaned data.
 
 import argparse
 import sys
+import numpy as np
 import pandas as pd
 import os
 import seaborn as sns
@@ -16,7 +17,7 @@ import seaborn as sns
 
 # Import the cleaning module (to be created separately)
 try:
-    from data_cleaner import clean_missing_values, remove_duplicates, convert_data_types
+    from data_cleaner import BACKENDS, clean_missing_values, remove_duplicates, convert_data_types
 except ImportError:
     print("Error: The cleaning module is missing. Make sure it's in the same directory.")
     sys.exit(1)
@@ -41,6 +42,13 @@ def parse_arguments():
     parser.add_argument('--remove-duplicates', action='store_true', help='Remove duplicate rows')
     parser.add_argument('--convert-types', action='store_true', help='Convert data types')
     parser.add_argument('--all', action='store_true', help='Apply all cleaning operations')
+    parser.add_argument('--chunksize', type=int,
+                        help='Stream the input in chunks of this many rows (e.g. 500000) and write '
+                             'results incrementally; missing values are filled per chunk. Requires --output')
+    parser.add_argument('--engine', type=str, default='c', choices=['c', 'pyarrow'],
+                        help='CSV parser engine (default: c)')
+    parser.add_argument('--backend', type=str, default='pandas', choices=BACKENDS,
+                        help='Library used to fill missing values and remove duplicates (default: pandas)')
     
     # Optional arguments for visualization
     parser.add_argument('--plot-column', type=str, help='Generate a visualization for the specified column')
@@ -62,19 +70,107 @@ def parse_arguments():
     if not args.input_file.lower().endswith('.csv'):
         parser.error(f"Input file must be a CSV file: {args.input_file}")
     
+    # Streaming mode never holds the full dataset in memory
+    if args.chunksize is not None:
+        if args.chunksize <= 0:
+            parser.error("--chunksize must be a positive integer")
+        if not args.output:
+            parser.error("--chunksize requires --output")
+        if args.plot_column:
+            parser.error("--chunksize cannot be combined with --plot-column")
+        if args.engine == 'pyarrow':
+            parser.error("--chunksize is not supported by the pyarrow engine")
+    
     return args
 
-def load_csv(file_path):
-    """Load data from a CSV file into a pandas DataFrame."""
+def load_csv(file_path, chunksize=None, engine='c'):
+    """
+    Load data from a CSV file into a pandas DataFrame.
+    
+    If chunksize is given, an iterator over DataFrame chunks is returned instead.
+    """
     try:
+        if chunksize:
+            print(f"Streaming data from {file_path} in chunks of {chunksize} rows...")
+            return pd.read_csv(file_path, chunksize=chunksize, low_memory=True, engine=engine)
         print(f"Loading data from {file_path}...")
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, engine=engine)
         print(f"Successfully loaded {len(df)} rows and {len(df.columns)} columns.")
         return df
     except Exception as e:
         print(f"Error loading CSV file: {e}")
         sys.exit(1)
 
+def _row_hashes(chunk):
+    """
+    Hash each row of a chunk.
+    
+    Whole numbers in float columns are hashed as int64, so a value hashes the
+    same whether its column was read as int in one chunk or as float in
+    another. Integer columns are never widened to float, which would merge
+    distinct values above 2**53.
+    """
+    column_hashes = {}
+    for i, (_, values) in enumerate(chunk.items()):
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(copy=True)
+        if pd.api.types.is_float_dtype(values):
+            whole = (values.notna() & (values % 1 == 0) & (values.abs() < 2**63)).to_numpy()
+            hashes[whole] = pd.util.hash_array(values.to_numpy()[whole].astype(np.int64))
+        column_hashes[i] = hashes
+    return pd.util.hash_pandas_object(pd.DataFrame(column_hashes), index=False)
+
+def _whole_floats_as_int(chunk):
+    """Cast float columns that hold only whole numbers to the nullable Int64 dtype."""
+    for column in chunk.select_dtypes(include='float').columns:
+        present = chunk[column].dropna()
+        if ((present % 1 == 0) & (present.abs() < 2**63)).all():
+            chunk[column] = chunk[column].astype('Int64')
+    return chunk
+
+def stream_clean_csv(chunks, output_path, handle_missing=False, remove_dups=False, convert_types=False,
+                     backend='pandas'):
+    """
+    Clean CSV chunks one at a time and append them to the output file.
+    
+    Duplicate rows are detected across the whole file by remembering a hash
+    of every row already written.
+    Float columns holding only whole numbers are written as integers, so a
+    column reads the same in every chunk whether or not a chunk had gaps.
+    """
+    seen_hashes = set()
+    total_rows = 0
+    first_chunk = True
+    
+    try:
+        for chunk in chunks:
+            if handle_missing:
+                chunk = clean_missing_values(chunk, backend=backend)
+            
+            if remove_dups:
+                # Check each hash against the set so the cost stays linear in the chunk size
+                row_hashes = _row_hashes(chunk)
+                is_new = ~row_hashes.duplicated().to_numpy()
+                is_new &= np.array([h not in seen_hashes for h in row_hashes], dtype=bool)
+                seen_hashes.update(row_hashes[is_new])
+                chunk = chunk[is_new]
+            
+            if convert_types:
+                chunk = convert_data_types(chunk)
+            
+            # A chunk with missing values reads integer columns as float, so whole
+            # numbers are written as integers whichever chunk held the gaps
+            chunk = _whole_floats_as_int(chunk)
+            
+            chunk.to_csv(output_path, mode='w' if first_chunk else 'a', header=first_chunk, index=False)
+            first_chunk = False
+            total_rows += len(chunk)
+    except Exception as e:
+        print(f"Error processing CSV file: {e}")
+        sys.exit(1)
+    
+    print(f"Cleaned data saved to {output_path}")
+    print(f"\nTotal rows after cleaning: {total_rows}")
+
 def save_or_display_results(df, output_path=None):
     """Save the DataFrame to a CSV file or display it."""
     if output_path:
@@ -96,20 +192,34 @@ def main():
     # Parse command-line arguments
     args = parse_arguments()
     
+    # Stream large files chunk by chunk straight to the output file
+    if args.chunksize:
+        if not (args.handle_missing or args.remove_duplicates or args.convert_types or args.all):
+            print("No cleaning operations specified. Use --handle-missing, --remove-duplicates, --convert-types, or --all")
+        stream_clean_csv(
+            load_csv(args.input_file, chunksize=args.chunksize),
+            args.output,
+            handle_missing=args.handle_missing or args.all,
+            remove_dups=args.remove_duplicates or args.all,
+            convert_types=args.convert_types or args.all,
+            backend=args.backend
+        )
+        return
+    
     # Load the CSV file
-    df = load_csv(args.input_file)
+    df = load_csv(args.input_file, engine=args.engine)
     
     # Apply cleaning operations based on arguments
     cleaning_applied = False
     
     if args.handle_missing or args.all:
         print("Cleaning missing values...")
-        df = clean_missing_values(df)
+        df = clean_missing_values(df, backend=args.backend)
         cleaning_applied = True
     
     if args.remove_duplicates or args.all:
         print("Removing duplicate rows...")
-        df = remove_duplicates(df)
+        df = remove_duplicates(df, backend=args.backend)
         cleaning_applied = True
     
     if args.convert_types or args.all: